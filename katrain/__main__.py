@@ -132,6 +132,8 @@ class KaTrainGui(Screen, KaTrainBase):
 
         self.animate_contributing = False
         self.message_queue = Queue()
+        self._pending_gui_update = None  # (cn, redraw_board) of the not yet drawn update_gui, if any
+        self._pending_gui_update_lock = threading.Lock()
 
         self.last_key_down = None
         self.last_focus_event = 0
@@ -287,7 +289,21 @@ class KaTrainGui(Screen, KaTrainBase):
                     self.game.analyze_extra("ponder")
                 else:
                     self.engine.stop_pondering()
-        Clock.schedule_once(lambda _dt: self.update_gui(cn, redraw_board=redraw_board), -1)  # trigger?
+        self._schedule_update_gui(cn, redraw_board=redraw_board)
+
+    def _schedule_update_gui(self, cn, redraw_board=False):
+        # bursts of state updates (analysis progress, ai moves) are collapsed into a single gui update per frame
+        with self._pending_gui_update_lock:
+            pending = self._pending_gui_update
+            self._pending_gui_update = (cn, redraw_board or (pending is not None and pending[1]))
+        if pending is None:
+            Clock.schedule_once(self._do_pending_update_gui, -1)
+
+    def _do_pending_update_gui(self, _dt=None):
+        with self._pending_gui_update_lock:
+            cn, redraw_board = self._pending_gui_update
+            self._pending_gui_update = None
+        self.update_gui(cn, redraw_board=redraw_board)
 
     def update_player(self, bw, **kwargs):
         super().update_player(bw, **kwargs)
@@ -329,9 +345,13 @@ class KaTrainGui(Screen, KaTrainBase):
                         )
                         continue
                 fn = getattr(self, f"_do_{msg}")
+                start_time = time.time()
                 fn(*args, **kwargs)
                 if msg != "update_state":
                     self._do_update_state()
+                time_taken = time.time() - start_time
+                if time_taken > 0.1:  # anything slower than this visibly delays the queue behind it
+                    self.log(f"Message {msg} took {time_taken:.2f}s to process", OUTPUT_DEBUG)
             except Exception as exc:
                 self.log(f"Exception in processing message {msg} {args}: {exc}", OUTPUT_ERROR)
                 traceback.print_exc()
@@ -634,11 +654,24 @@ class KaTrainGui(Screen, KaTrainBase):
 
         url_match = re.match(r"(?P<url>https?://[^\s]+)", clipboard)
         if url_match:
-            self.log("Recognized url: " + url_match.group(), OUTPUT_INFO)
-            http = urllib3.PoolManager()
-            response = http.request("GET", url_match.group())
-            clipboard = response.data.decode("utf-8")
+            url = url_match.group()
+            self.log("Recognized url: " + url, OUTPUT_INFO)
+
+            def fetch_url():  # keep network I/O off the main thread, then load the result back on it
+                try:
+                    http = urllib3.PoolManager()
+                    response = http.request("GET", url)
+                    contents = response.data.decode("utf-8")
+                    Clock.schedule_once(lambda _dt: self._load_sgf_from_clipboard_contents(contents), -1)
+                except Exception as exc:
+                    error = i18n._("Failed to import from clipboard").format(error=exc, contents=url[:50])
+                    Clock.schedule_once(lambda _dt: self.controls.set_status(error, STATUS_INFO), -1)
+
+            threading.Thread(target=fetch_url, daemon=True).start()
+        else:
+            self._load_sgf_from_clipboard_contents(clipboard)
 
+    def _load_sgf_from_clipboard_contents(self, clipboard):
         try:
             move_tree = KaTrainSGF.parse_sgf(clipboard)
         except Exception as exc:
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 import heapq
 import math
 import random
+import threading
 import time
 from typing import Dict, List, Optional, Tuple
 
@@ -216,17 +217,20 @@ class AIStrategy(ABC):
         self.game.katrain.log(f"[{self.strategy_name}] Requesting analysis with settings: {extra_settings}", OUTPUT_DEBUG)
         error = False
         analysis = None
+        done = threading.Event()
 
         def set_analysis(a, partial_result):
             nonlocal analysis
             if not partial_result:
                 analysis = a
                 self.game.katrain.log(f"[{self.strategy_name}] Analysis received", OUTPUT_DEBUG)
+                done.set()
 
         def set_error(a):
             nonlocal error
             self.game.katrain.log(f"[{self.strategy_name}] Error in additional analysis query: {a}", OUTPUT_ERROR)
             error = True
+            done.set()
 
         engine = self.game.engines[self.cn.player]
         engine.request_analysis(
@@ -238,8 +242,7 @@ class AIStrategy(ABC):
             extra_settings=extra_settings,
         )
         self.game.katrain.log(f"[{self.strategy_name}] Waiting for analysis to complete...", OUTPUT_DEBUG)
-        while not (error or analysis):
-            time.sleep(0.01)  # TODO: prevent deadlock if esc, check node in queries?
+        while not done.wait(0.1):  # TODO: prevent deadlock if esc, check node in queries?
             engine.check_alive(exception_if_dead=True)
         
         if analysis:
@@ -1326,12 +1329,14 @@ class HumanStyleStrategy(AIStrategy):
         
         # Request analysis from engine - note includePolicy is a direct parameter
         analysis = None
+        done = threading.Event()
         
         def set_analysis(a, partial_result):
             nonlocal analysis
             if not partial_result:
                 self.game.katrain.log(f"[HumanStyleStrategy] Full analysis results received", OUTPUT_DEBUG)
                 analysis = a
+                done.set()
                 # Log some analysis stats for debugging
                 if a:
                     self.game.katrain.log(f"[HumanStyleStrategy] Analysis contains humanPolicy: {'humanPolicy' in a}", OUTPUT_DEBUG)
@@ -1346,6 +1351,7 @@ class HumanStyleStrategy(AIStrategy):
         def set_error(a):
             nonlocal error
             error = True
+            done.set()
             self.game.katrain.log(f"[HumanStyleStrategy] Error in human analysis query: {a}", OUTPUT_ERROR)
             self.game.katrain.log(f"[HumanStyleStrategy] Will attempt to fall back to policy move", OUTPUT_DEBUG)
             
@@ -1367,12 +1373,10 @@ class HumanStyleStrategy(AIStrategy):
         
         # Wait for analysis to complete
         wait_count = 0
-        while not (error or analysis):
-            import time
-            time.sleep(0.01)
+        while not done.wait(0.1):
             wait_count += 1
-            if wait_count % 100 == 0:  # Log every 1 second
-                self.game.katrain.log(f"[HumanStyleStrategy] Still waiting for analysis results ({wait_count/100:.1f}s)", OUTPUT_DEBUG)
+            if wait_count % 10 == 0:  # Log every 1 second
+                self.game.katrain.log(f"[HumanStyleStrategy] Still waiting for analysis results ({wait_count/10:.1f}s)", OUTPUT_DEBUG)
             engine.check_alive(exception_if_dead=True)
         
         self.game.katrain.log(f"[HumanStyleStrategy] Finished waiting for analysis, error={error}, analysis received={analysis is not None}", OUTPUT_DEBUG)
@@ -275,6 +275,7 @@ TOP_MOVE_OPTIONS = [
 ]
 REPORT_DT = 1
 PONDERING_REPORT_DT = 0.25
+PARTIAL_RESULT_UPDATE_DT = 0.1  # min time between gui updates triggered by partial analysis results
 
 SGF_INTERNAL_COMMENTS_MARKER = "\u3164\u200b"
 SGF_SEPARATOR_MARKER = "\u3164\u3164"
@@ -20,6 +20,7 @@ from katrain.core.constants import (
     DATA_FOLDER,
     KATAGO_EXCEPTION,
     PONDERING_REPORT_DT,
+    PARTIAL_RESULT_UPDATE_DT,
 )
 from katrain.core.game_node import GameNode
 from katrain.core.lang import i18n
@@ -103,6 +104,8 @@ class KataGoEngine(BaseEngine):
         self.queries = {}  # outstanding query id -> start time and callback
         self.ponder_query = None
         self.query_counter = 0
+        self.last_partial_result_update = 0
+        self.partial_result_update_timer = None
         self.katago_process = None
         self.base_priority = 0
         self.override_settings = {"reportAnalysisWinratesAs": "BLACK"}  # force these settings
@@ -300,6 +303,7 @@ class KataGoEngine(BaseEngine):
                         )
                     continue
                 callback, error_callback, start_time, next_move, _ = self.queries[query_id]
+                update_state = True
                 if "error" in analysis:
                     del self.queries[query_id]
                     if error_callback:
@@ -314,6 +318,8 @@ class KataGoEngine(BaseEngine):
                     partial_result = analysis.get("isDuringSearch", False)
                     if not partial_result:
                         del self.queries[query_id]
+                    else:  # many queries can report at once, e.g. when analyzing a game, no need to redraw for each
+                        update_state = self._partial_result_update_due()
                     time_taken = time.time() - start_time
                     results_exist = not analysis.get("noResults", False)
                     self.katrain.log(
@@ -327,12 +333,29 @@ class KataGoEngine(BaseEngine):
                     except Exception as e:
                         self.katrain.log(f"Error in engine callback for query {query_id}: {e}", OUTPUT_ERROR)
                         traceback.print_exc()
-                if getattr(self.katrain, "update_state", None):  # easier mocking etc
+                if update_state and getattr(self.katrain, "update_state", None):  # easier mocking etc
                     self.katrain.update_state()
             except Exception as e:
                 self.katrain.log(f"Unexpected exception {e} while processing KataGo output {line}", OUTPUT_ERROR)
                 traceback.print_exc()
 
+    def _partial_result_update_due(self):
+        wait = self.last_partial_result_update + PARTIAL_RESULT_UPDATE_DT - time.time()
+        if wait <= 0:
+            self.last_partial_result_update = time.time()
+            return True
+        if self.partial_result_update_timer is None:  # make sure the skipped result is drawn once the interval passed
+            self.partial_result_update_timer = threading.Timer(wait, self._trailing_partial_result_update)
+            self.partial_result_update_timer.daemon = True
+            self.partial_result_update_timer.start()
+        return False
+
+    def _trailing_partial_result_update(self):
+        self.partial_result_update_timer = None
+        self.last_partial_result_update = time.time()
+        if getattr(self.katrain, "update_state", None):  # easier mocking etc
+            self.katrain.update_state()
+
     def _write_stdin_thread(self):  # flush only in a thread since it returns only when the other program reads
         while self.katago_process is not None:
             try:
@@ -366,13 +389,16 @@ class KataGoEngine(BaseEngine):
                 if not terminate:
                     self.queries[query["id"]] = (callback, error_callback, time.time(), next_move, node)
                 tag = "ponder " if ponder else ("terminate " if terminate else "")
-                self.katrain.log(f"Sending {tag}query {query['id']}: {json.dumps(query)}", OUTPUT_DEBUG)
-                try:
-                    self.katago_process.stdin.write((json.dumps(query) + "\n").encode())
-                    self.katago_process.stdin.flush()
-                except OSError as e:
-                    self.katrain.log(f"Exception in writing to katago: {e}", OUTPUT_DEBUG)
-                    return  # some other thread will take care of this
+                query_json = json.dumps(query)  # serialize once for both the log and the engine
+                process = self.katago_process
+            # write outside the lock, flush blocks until katago reads and this is the only thread writing
+            self.katrain.log(f"Sending {tag}query {query['id']}: {query_json}", OUTPUT_DEBUG)
+            try:
+                process.stdin.write((query_json + "\n").encode())
+                process.stdin.flush()
+            except (OSError, AttributeError) as e:  # AttributeError: process shut down meanwhile
+                self.katrain.log(f"Exception in writing to katago: {e}", OUTPUT_DEBUG)
+                return  # some other thread will take care of this
 
     def send_query(self, query, callback, error_callback, next_move=None, node=None):
         self.write_queue.put((query, callback, error_callback, next_move, node))
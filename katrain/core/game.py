@@ -110,8 +110,9 @@ class BaseGame:
         self.main_time_used = 0
 
         # restore shortcuts
-        shortcut_id_to_node = {node.get_property("KTSID", None): node for node in self.root.nodes_in_tree}
-        for node in self.root.nodes_in_tree:
+        all_nodes = self.root.nodes_in_tree
+        shortcut_id_to_node = {node.get_property("KTSID", None): node for node in all_nodes}
+        for node in all_nodes:
             shortcut_id = node.get_property("KTSF", None)
             if shortcut_id and shortcut_id in shortcut_id_to_node:
                 shortcut_id_to_node[shortcut_id].add_shortcut(node)
@@ -301,7 +302,7 @@ class BaseGame:
     @property
     def stones(self):
         with self._lock:
-            return sum(self.chains, [])
+            return [stone for chain in self.chains for stone in chain]
 
     @property
     def end_result(self):
@@ -633,11 +634,7 @@ class Game(BaseGame):
             board_size_x, board_size_y = self.board_size
 
             if cn.analysis_exists:
-                policy_grid = (
-                    var_to_grid(self.current_node.policy, size=(board_size_x, board_size_y))
-                    if self.current_node.policy
-                    else None
-                )
+                policy_grid = self.current_node.policy_grid
                 analyze_moves = sorted(
                     [
                         Move(coords=(x, y), player=cn.next_player)
@@ -22,13 +22,15 @@ from katrain.gui.theme import Theme
 
 
 def analysis_dumps(analysis):
-    analysis = copy.deepcopy(analysis)
-    for movedict in analysis["moves"].values():
-        if "ownership" in movedict:  # per-move ownership rarely used
-            del movedict["ownership"]
-    ownership_data = pack_floats(analysis.pop("ownership"))
-    policy_data = pack_floats(analysis.pop("policy"))
-    main_data = json.dumps(analysis).encode("utf-8")
+    ownership_data = pack_floats(analysis["ownership"])
+    policy_data = pack_floats(analysis["policy"])
+    main_analysis = {  # shallow copies only, a deepcopy would also copy all the float arrays we leave out
+        **{k: v for k, v in analysis.items() if k not in ["ownership", "policy"]},
+        "moves": {  # per-move ownership rarely used
+            gtp: {k: v for k, v in movedict.items() if k != "ownership"} for gtp, movedict in analysis["moves"].items()
+        },
+    }
+    main_data = json.dumps(main_analysis).encode("utf-8")
     return [
         base64.standard_b64encode(gzip.compress(data)).decode("utf-8")
         for data in [ownership_data, policy_data, main_data]
@@ -85,6 +87,7 @@ class GameNode(SGFNode):
                 "policy": unpack_floats(policy_data, board_squares + 1),
                 "ownership": unpack_floats(ownership_data, board_squares),
             }
+            self._analysis_version += 1
             return True
         except Exception as e:
             print(f"Error in loading analysis: {e}")
@@ -107,6 +110,9 @@ class GameNode(SGFNode):
     def clear_analysis(self):
         self.analysis_visits_requested = 0
         self.analysis = {"moves": {}, "root": None, "ownership": None, "policy": None, "completed": False}
+        self._grid_cache = {}
+        self._analysis_version = getattr(self, "_analysis_version", 0) + 1  # bumped on every change to analysis
+        self._candidate_moves_cache = None
 
     def sgf_properties(
         self,
@@ -227,6 +233,7 @@ class GameNode(SGFNode):
                 cur.update(move_analysis)
             else:  # prior etc only
                 cur.update({k: v for k, v in move_analysis.items() if k not in cur})
+        self._analysis_version += 1
 
     def set_analysis(
         self,
@@ -263,6 +270,7 @@ class GameNode(SGFNode):
                     )  # update analysis in parent for consistency
             is_normal_query = refine_move is None and not additional_moves
             self.analysis["completed"] = self.analysis["completed"] or (is_normal_query and not partial_result)
+        self._analysis_version += 1
 
     @property
     def ownership(self):
@@ -272,6 +280,24 @@ class GameNode(SGFNode):
     def policy(self):
         return self.analysis.get("policy")
 
+    def _analysis_grid(self, key):
+        values = self.analysis.get(key)
+        if not values:
+            return None
+        cached = self._grid_cache.get(key)
+        if cached is None or cached[0] is not values:  # new analysis replaces the list, invalidating the grid
+            cached = (values, var_to_grid(values, size=self.board_size))
+            self._grid_cache[key] = cached
+        return cached[1]
+
+    @property
+    def ownership_grid(self):  # cached, do not modify
+        return self._analysis_grid("ownership")
+
+    @property
+    def policy_grid(self):  # cached, do not modify
+        return self._analysis_grid("policy")
+
     @property
     def analysis_exists(self):
         return self.analysis["root"] is not None
@@ -414,6 +440,14 @@ class GameNode(SGFNode):
 
     @property
     def candidate_moves(self) -> List[Dict]:
+        version = self._analysis_version  # read before computing, so concurrent updates invalidate the result
+        cached = self._candidate_moves_cache
+        if cached is None or cached[0] != version:
+            cached = (version, self._calculate_candidate_moves())
+            self._candidate_moves_cache = cached
+        return list(cached[1])  # cached for speed, do not modify the move dicts
+
+    def _calculate_candidate_moves(self) -> List[Dict]:
         if not self.analysis_exists:
             return []
         if not self.analysis["moves"]:
@@ -450,9 +484,9 @@ class GameNode(SGFNode):
 
     @property
     def policy_ranking(self) -> Optional[List[Tuple[float, Move]]]:  # return moves from highest policy value to lowest
-        if self.policy:
+        policy, policy_grid = self.policy, self.policy_grid
+        if policy and policy_grid is not None:  # analysis may be cleared in between
             szx, szy = self.board_size
-            policy_grid = var_to_grid(self.policy, size=(szx, szy))
             moves = [(policy_grid[y][x], Move((x, y), player=self.next_player)) for x in range(szx) for y in range(szy)]
-            moves.append((self.policy[-1], Move(None, player=self.next_player)))
+            moves.append((policy[-1], Move(None, player=self.next_player)))
             return sorted(moves, key=lambda mp: -mp[0])
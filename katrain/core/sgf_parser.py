@@ -3,6 +3,7 @@ import chardet
 import math
 import re
 from collections import defaultdict
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 
@@ -13,6 +14,7 @@ class ParseError(Exception):
 
 
 class Move:
+    __slots__ = ("player", "coords")  # created in bulk, e.g. every policy_ranking call builds one per point
     GTP_COORD = list("ABCDEFGHJKLMNOPQRSTUVWXYZ") + [
         xa + c for xa in "ABCDEFGH" for c in "ABCDEFGHJKLMNOPQRSTUVWXYZ"
     ]  # board size 52+ support
@@ -22,10 +24,15 @@ class Move:
     @classmethod
     def from_gtp(cls, gtp_coords, player="B"):
         """Initialize a move from GTP coordinates and player"""
+        return cls(coords=cls._gtp_to_coords(gtp_coords), player=player)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)  # analysis and pvs parse the same few hundred coordinates over and over
+    def _gtp_to_coords(gtp_coords):
         if "pass" in gtp_coords.lower():
-            return cls(coords=None, player=player)
+            return None
         match = re.match(r"([A-Z]+)(\d+)", gtp_coords)
-        return cls(coords=(Move.GTP_COORD.index(match[1]), int(match[2]) - 1), player=player)
+        return Move.GTP_COORD.index(match[1]), int(match[2]) - 1
 
     @classmethod
     def from_sgf(cls, sgf_coords, board_size, player="B"):
@@ -85,6 +92,7 @@ class SGFNode:
     def __init__(self, parent=None, properties=None, move=None):
         self.children = []
         self.properties = defaultdict(list)
+        self._board_size = None
         if properties:
             for k, v in properties.items():
                 self.set_property(k, v)
@@ -206,13 +214,17 @@ class SGFNode:
     @property
     def board_size(self) -> Tuple[int, int]:
         """Retrieves the root's SZ property, or 19 if missing. Parses it, and returns board size as a tuple x,y"""
-        size = str(self.root.get_property("SZ", "19"))
-        if ":" in size:
-            x, y = map(int, size.split(":"))
-        else:
-            x = int(size)
-            y = x
-        return x, y
+        root = self.root
+        size = root.get_property("SZ", "19")
+        if root._board_size is None or root._board_size[0] != size:  # cached for speed, keyed on the raw property
+            size_str = str(size)
+            if ":" in size_str:
+                x, y = map(int, size_str.split(":"))
+            else:
+                x = int(size_str)
+                y = x
+            root._board_size = (size, (x, y))
+        return root._board_size[1]
 
     @property
     def komi(self) -> float:
@@ -612,7 +612,8 @@ class BadukPanWidget(Widget):
 
             # ownership - allow one move out of date for smooth animation,
             # drawn first so the board is shaded underneath all other elements.
-            ownership = current_node.ownership or (current_node.parent and current_node.parent.ownership)
+            ownership_node = current_node if current_node.ownership else current_node.parent
+            ownership = ownership_node and ownership_node.ownership
             if katrain.analysis_controls.ownership.active and ownership:
                 if (
                     current_node.children
@@ -631,14 +632,13 @@ class BadukPanWidget(Widget):
                             )
                     self.draw_territory(loss_grid, Theme.EVAL_COLORS[self.trainer_config["theme"]][1][:3])
                 else:
-                    ownership_grid = var_to_grid(ownership, (board_size_x, board_size_y))
-                    self.draw_territory(ownership_grid)
+                    ownership_grid = ownership_node.ownership_grid
+                    if ownership_grid is not None:  # analysis may have been cleared since checking ownership
+                        self.draw_territory(ownership_grid)
             # stones
             all_dots_off = not katrain.analysis_controls.eval.active
-            has_stone = {}
+            has_stone = {m.coords: m.player for m in katrain.game.stones}
             drawn_stone = {}
-            for m in katrain.game.stones:
-                has_stone[m.coords] = m.player
 
             show_dots_for = {
                 p: self.trainer_config["eval_show_ai"] or katrain.players_info[p].human for p in Move.PLAYERS
@@ -693,22 +693,22 @@ class BadukPanWidget(Widget):
                     self.draw_stone(2, y, "W", evalcol=evalcol, evalscale=y / (board_size_y - 1))
                     self.draw_stone(3, y, "W", innercol=Theme.STONE_COLORS["B"], evalcol=evalcol)
 
-            policy = current_node.policy
+            policy_node = current_node
             if (
-                not policy
+                not current_node.policy
                 and current_node.parent
                 and current_node.parent.policy
                 and katrain.last_player_info.ai
                 and katrain.next_player_info.ai
             ):
-                policy = (
-                    current_node.parent.policy
-                )  # in the case of AI self-play we allow the policy to be one step out of date
+                # in the case of AI self-play we allow the policy to be one step out of date
+                policy_node = current_node.parent
+            policy = policy_node.policy
 
             pass_btn = katrain.board_controls.pass_btn
             pass_btn.canvas.after.clear()
-            if katrain.analysis_controls.policy.active and policy:
-                policy_grid = var_to_grid(policy, (board_size_x, board_size_y))
+            policy_grid = policy_node.policy_grid if katrain.analysis_controls.policy.active and policy else None
+            if policy_grid is not None:  # analysis may have been cleared since checking policy
                 best_move_policy = max(*policy)
                 colors = Theme.EVAL_COLORS[self.trainer_config["theme"]]
                 text_lb = 0.01 * 0.01
@@ -82,6 +82,7 @@ class ControlsPanel(BoxLayout):
         self.last_timer_update = (None, 0, False)
         self.beep_start = 5.2
         self.timer_interval = 0.07
+        self.min_timer_update_interval = 0.05  # skip extra updates in between ticks
 
         Clock.schedule_interval(self.update_timer, self.timer_interval)
 
@@ -183,17 +184,20 @@ class ControlsPanel(BoxLayout):
         current_node = game and self.katrain.game.current_node
         if current_node:
             last_update_node, last_update_time, beeping = self.last_timer_update
-            new_beeping = beeping
             now = time.time()
-            main_time = self.katrain.config("timer/main_time", 0) * 60
-            byo_len = max(1, self.katrain.config("timer/byo_length"))
-            byo_num = max(1, self.katrain.config("timer/byo_periods"))
-            sounds_on = self.katrain.config("timer/sound")
+            if last_update_node == current_node and now - last_update_time < self.min_timer_update_interval:
+                return  # called on every gui update as well, nothing to do when the clock has barely moved
+            new_beeping = beeping
+            timer_settings = self.katrain.config("timer")
+            main_time = timer_settings.get("main_time", 0) * 60
+            byo_len = max(1, timer_settings.get("byo_length"))
+            byo_num = max(1, timer_settings.get("byo_periods"))
+            sounds_on = timer_settings.get("sound")
             player = self.katrain.next_player_info
             ai = player.ai
             used_period = False
 
-            min_use = self.katrain.config("timer/minimal_use", 0)
+            min_use = timer_settings.get("minimal_use", 0)
             boing_at_remaining = byo_len - min_use
             main_time_remaining = main_time - game.main_time_used
 
@@ -634,9 +634,9 @@ class BaseConfigPopup(QuickConfigGui):
 
         dist_models = {k: v for k, v in self.katrain.config("dist_models", {}).items() if k in self.MODEL_ENDPOINTS}
 
+        http = urllib3.PoolManager()  # shared, so requests to the same host reuse the connection
         for name, url in self.MODEL_ENDPOINTS.items():
             try:
-                http = urllib3.PoolManager()
                 response = http.request("GET", url)
                 if response.status != 200:
                     raise Exception(
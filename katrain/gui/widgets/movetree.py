@@ -1,3 +1,4 @@
+import heapq
 from collections import defaultdict
 
 from kivy.graphics.context_instructions import Color
@@ -89,7 +90,8 @@ class MoveTreeCanvas(Widget):
         if selected_node and selected_node.parent:
             node = selected_node
             while node.parent is not None:
-                node.parent.children = [node]
+                if len(node.parent.children) > 1:
+                    node.parent.children = [node]
                 node = node.parent
             self.set_game_node(selected_node)
         self.is_open = False
@@ -99,8 +101,10 @@ class MoveTreeCanvas(Widget):
         if selected_node and selected_node.parent:
             node = selected_node
             while node.parent is not None:
-                node.parent.children.remove(node)
-                node.parent.children.insert(0, node)
+                siblings = node.parent.children
+                if siblings[0] is not node:  # most levels are already on the main branch
+                    siblings.remove(node)
+                    siblings.insert(0, node)
                 node = node.parent
             self.set_game_node(selected_node)
         self.is_open = False
@@ -121,11 +125,12 @@ class MoveTreeCanvas(Widget):
         pos = self.move_pos.get(self.scroll_view_widget.current_node)
         if not self.scroll_view_widget or not pos:
             return
-        same_x_moves = sorted([(y, n) for n, (x, y) in self.move_pos.items() if x == pos[0]])
-        new_index = next((i for i, (y, n) in enumerate(same_x_moves) if y == pos[1]), 0) + direction
-        if new_index < 0 or new_index >= len(same_x_moves):
+        x, y = pos
+        # only the nearest moves in the given direction matter, so no need to sort the whole column
+        candidates = [(abs(ny - y), n) for n, (nx, ny) in self.move_pos.items() if nx == x and (ny - y) * direction > 0]
+        if not direction or len(candidates) < abs(direction):
             return
-        self.set_game_node(same_x_moves[new_index][1])
+        self.set_game_node(heapq.nsmallest(abs(direction), candidates, key=lambda dn: dn[0])[-1][1])
 
     def draw_move_tree(self, current_node, insert_node):
         if not self.scroll_view_widget or not current_node:
@@ -140,3 +140,13 @@ class TestBoard:
                     b.play(Move.from_gtp("B19", player="W"))
                 assert 4 == len(b.stones)
                 assert 0 == len(b.prisoners)
+
+    def test_candidate_moves_update(self, new_game):
+        root_info = {"scoreLead": 1.0, "winrate": 0.6, "visits": 10}
+        move_info = {"move": "Q16", "order": 0, "scoreLead": 1.0, "winrate": 0.6, "visits": 8, "pv": ["Q16"]}
+        new_game.set_analysis({"rootInfo": root_info, "moveInfos": [move_info]})
+        assert ["Q16"] == [d["move"] for d in new_game.candidate_moves]
+        new_game.set_analysis({"rootInfo": root_info, "moveInfos": [{**move_info, "move": "D4", "visits": 9}]})
+        assert ["D4", "Q16"] == [d["move"] for d in new_game.candidate_moves]
+        new_game.clear_analysis()
+        assert [] == new_game.candidate_moves
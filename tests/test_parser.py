@@ -21,6 +21,19 @@ def test_branch():
     assert input_sgf == root.sgf()
 
 
+def test_nodes_from_root():
+    input_sgf = "(;GM[1]FF[4]SZ[19];B[dp];W[pp](;B[pj])(;B[dd];W[dj]))"
+    root = SGF.parse_sgf(input_sgf)
+    main_leaf = root.children[0].children[0].children[0]
+    branch_leaf = root.children[0].children[0].children[1].children[0]
+    assert [root, root.children[0], root.children[0].children[0], main_leaf] == main_leaf.nodes_from_root
+    path = branch_leaf.nodes_from_root
+    assert [n.move.gtp() for n in path[1:]] == ["D4", "Q4", "D16", "D10"]
+    path.append(root)  # returned list is a copy
+    assert branch_leaf == branch_leaf.nodes_from_root[-1]
+    assert [root] == root.nodes_from_root
+
+
 def test_dragon_weirdness():  # dragon go server has weird line breaks
     input_sgf = "\n(\n\n;\nGM[1]\nFF[4]\nCA[UTF-8]AP[Sabaki:0.43.3]KM[6.5]SZ[19]DT[2020-04-12]AB[dd]\n[dj]\n(\n;\nB[dp]\n;\nW[pp]\n(\n;\nB[pj]\n)\n(\n;\nPL[B]\nAW[jp]\nC[sdfdsfdsf]\n)\n)\n(\n;\nB[pd]\n)\n)\n"
     root = SGF.parse_sgf(input_sgf)